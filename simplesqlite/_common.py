@@ -1,4 +1,6 @@
-from collections import OrderedDict
+from collections.abc import Mapping
+from operator import itemgetter
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Final, Optional
 
 from dataproperty.typing import TypeHint
@@ -14,23 +16,27 @@ _sqlitetype_to_typepy: Final = {
     "REAL": RealNumber,
     "TEXT": String,
 }
+_get_attr_fields: Final = itemgetter(
+    SchemaHeader.ATTR_NAME, SchemaHeader.KEY, SchemaHeader.INDEX, SchemaHeader.DATA_TYPE
+)
 
 
 def extract_table_metadata(
     con: "SimpleSQLite", table_name: str
-) -> tuple[Optional[str], list[str], dict[str, TypeHint]]:
+) -> tuple[Optional[str], tuple[str, ...], Mapping[str, TypeHint]]:
     primary_key = None
-    index_attrs = []
-    type_hints = OrderedDict()
+    index_attrs: list[str] = []
+    type_hints: dict[str, TypeHint] = {}
 
-    for attr in con.schema_extractor.fetch_table_schema(table_name).as_dict()[table_name]:
-        attr_name = attr[SchemaHeader.ATTR_NAME]
+    to_typepy = _sqlitetype_to_typepy.get
+    attrs = con._fetch_table_schema(table_name).as_dict()[table_name]
 
-        if attr[SchemaHeader.KEY] == "PRI":
+    for attr_name, key, index, data_type in map(_get_attr_fields, attrs):
+        if key == "PRI":
             primary_key = attr_name
-        elif attr[SchemaHeader.INDEX]:
+        elif index:
             index_attrs.append(attr_name)
 
-        type_hints[attr_name] = _sqlitetype_to_typepy.get(attr[SchemaHeader.DATA_TYPE])
+        type_hints[attr_name] = to_typepy(data_type)
 
-    return (primary_key, index_attrs, type_hints)
+    return (primary_key, tuple(index_attrs), MappingProxyType(type_hints))
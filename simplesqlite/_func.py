@@ -2,34 +2,44 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-from textwrap import dedent
-from typing import TYPE_CHECKING
+import functools
+import sqlite3
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Final, Optional
 
 from pathvalidate.error import ErrorReason, ValidationError
 
-from ._common import extract_table_metadata
 from ._logger import logger
 from ._validator import validate_sqlite_attr_name, validate_sqlite_table_name
-from .error import NameValidationError
+from .error import NameValidationError, OperationalError, TableNotFoundError
 
 
 if TYPE_CHECKING:
     from simplesqlite import SimpleSQLite  # noqa
 
 
+FETCH_CHUNK_SIZE: Final = 10000
+_SRC_SCHEMA_NAME: Final = "simplesqlite_src"
+
+
 def validate_table_name(name: str) -> None:
     """
     :param str name: Table name to validate.
     :raises NameValidationError: |raises_validate_table_name|
     """
 
+    # names that are not str, which may be unhashable, are validated without the cache
+    if isinstance(name, str) and _is_valid_table_name(name):
+        return
+
     try:
         validate_sqlite_table_name(name)
     except ValidationError as e:
         if e.reason == ErrorReason.RESERVED_NAME and e.reusable_name:
             pass
         else:
-            raise NameValidationError(e)
+            raise NameValidationError(e) from e
 
 
 def validate_attr_name(name: str) -> None:
@@ -38,10 +48,35 @@ def validate_attr_name(name: str) -> None:
     :raises NameValidationError: |raises_validate_attr_name|
     """
 
+    # names that are not str, which may be unhashable, are validated without the cache
+    if isinstance(name, str) and _is_valid_attr_name(name):
+        return
+
     try:
         validate_sqlite_attr_name(name)
     except ValidationError as e:
-        raise NameValidationError(e)
+        raise NameValidationError(e) from e
+
+
+# only the validity is memoized: errors are raised by the validators at each call
+@functools.lru_cache(maxsize=1024)
+def _is_valid_table_name(name: str) -> bool:
+    try:
+        validate_sqlite_table_name(name)
+    except ValidationError as e:
+        return e.reason == ErrorReason.RESERVED_NAME and bool(e.reusable_name)
+
+    return True
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_attr_name(name: str) -> bool:
+    try:
+        validate_sqlite_attr_name(name)
+    except ValidationError:
+        return False
+
+    return True
 
 
 def append_table(src_con: "SimpleSQLite", dst_con: "SimpleSQLite", table_name: str) -> bool:
@@ -60,40 +95,24 @@ def append_table(src_con: "SimpleSQLite", dst_con: "SimpleSQLite", table_name: s
     """
 
     logger.debug(
-        "append table: src={src_db}.{src_tbl}, dst={dst_db}.{dst_tbl}".format(
-            src_db=src_con.database_path,
-            src_tbl=table_name,
-            dst_db=dst_con.database_path,
-            dst_tbl=table_name,
-        )
+        "append table: src={}.{}, dst={}.{}",
+        src_con.database_path,
+        table_name,
+        dst_con.database_path,
+        table_name,
     )
 
     src_con.verify_table_existence(table_name)
     dst_con.validate_access_permission(["w", "a"])
 
-    if dst_con.has_table(table_name):
-        src_attrs = src_con.fetch_attr_names(table_name)
+    try:
+        # fetch_attr_names verifies the table existence by itself:
+        # avoid another query by has_table
         dst_attrs = dst_con.fetch_attr_names(table_name)
-        if src_attrs != dst_attrs:
-            raise ValueError(
-                dedent(
-                    """
-                    source and destination attribute is different from each other
-                    src: {}
-                    dst: {}
-                    """.format(src_attrs, dst_attrs)
-                )
-            )
+    except TableNotFoundError:
+        return _copy_to_new_table(src_con, dst_con, table_name, table_name)
 
-    primary_key, index_attrs, type_hints = extract_table_metadata(src_con, table_name)
-
-    dst_con.create_table_from_tabledata(
-        src_con.select_as_tabledata(table_name, type_hints=type_hints),
-        primary_key=primary_key,
-        index_attrs=index_attrs,
-    )
-
-    return True
+    return _append_to_existing_table(src_con, dst_con, table_name, dst_attrs)
 
 
 def copy_table(
@@ -120,12 +139,11 @@ def copy_table(
     """
 
     logger.debug(
-        "copy table: src={src_db}.{src_tbl}, dst={dst_db}.{dst_tbl}".format(
-            src_db=src_con.database_path,
-            src_tbl=src_table_name,
-            dst_db=dst_con.database_path,
-            dst_tbl=dst_table_name,
-        )
+        "copy table: src={}.{}, dst={}.{}",
+        src_con.database_path,
+        src_table_name,
+        dst_con.database_path,
+        dst_table_name,
     )
 
     src_con.verify_table_existence(src_table_name)
@@ -141,18 +159,263 @@ def copy_table(
             )
             return False
 
-    primary_key, index_attrs, _ = extract_table_metadata(src_con, src_table_name)
+    return _copy_to_new_table(src_con, dst_con, src_table_name, dst_table_name)
 
-    result = src_con.select(select="*", table_name=src_table_name)
-    if result is None:
-        return False
 
-    dst_con.create_table_from_data_matrix(
-        dst_table_name,
-        src_con.fetch_attr_names(src_table_name),
-        result.fetchall(),
-        primary_key=primary_key,
-        index_attrs=index_attrs,
-    )
+def _copy_to_new_table(
+    src_con: "SimpleSQLite", dst_con: "SimpleSQLite", src_table_name: str, dst_table_name: str
+) -> bool:
+    """
+    Create a destination table with the same attribute types as the source table,
+    and copy records of the source table to it.
+    """
+
+    from tabledata import TableData
+
+    from ._sanitizer import SQLiteTableDataSanitizer
+    from .query import Attr, AttrList
+
+    primary_key, index_attrs, _ = src_con._extract_table_metadata(src_table_name)
+    _verify_records_existence(src_con, src_table_name)
+
+    src_attr_names, data_types = zip(*_fetch_table_info(src_con, src_table_name))
+
+    # normalize names in the same manner as create_table_from_tabledata
+    table_data = SQLiteTableDataSanitizer(
+        TableData(dst_table_name, src_attr_names, []), dup_col_handler=dst_con.dup_col_handler
+    ).normalize()
+    table_name = table_data.table_name
+    assert table_name
+
+    attr_descs = []
+    for src_attr_name, dst_attr_name, data_type in zip(
+        src_attr_names, table_data.headers, data_types
+    ):
+        attr_desc = str(Attr(dst_attr_name))
+        if data_type:
+            # an attribute without a declared type is created without a type to keep its affinity
+            attr_desc += f" {data_type}"
+        if src_attr_name == primary_key:
+            attr_desc += " PRIMARY KEY"
+        attr_descs.append(attr_desc)
+
+    src_schema_name = _get_src_schema_name(src_con, dst_con)
+    with _open_src_schema(src_con, dst_con, src_schema_name):
+        dst_con.create_table(table_name, attr_descs)
+        _copy_records(
+            src_con,
+            dst_con,
+            src_schema_name,
+            src_table_name,
+            src_attr_names,
+            table_name,
+            table_data.headers,
+        )
+        if index_attrs:
+            dst_con.create_index_list(table_name, AttrList.sanitize(index_attrs))
+
+    return True
+
+
+def _append_to_existing_table(
+    src_con: "SimpleSQLite", dst_con: "SimpleSQLite", table_name: str, dst_attrs: list[str]
+) -> bool:
+    """
+    Append records of a source table to the existing table that has the same attributes.
+    """
+
+    from .query import AttrList
+
+    _, index_attrs, type_hints = src_con._extract_table_metadata(table_name)
+
+    src_attrs = list(type_hints)
+    if src_attrs != dst_attrs:
+        raise ValueError(
+            "source and destination attribute is different from each other\n"
+            f"src: {src_attrs}\n"
+            f"dst: {dst_attrs}"
+        )
+
+    _verify_records_existence(src_con, table_name)
+
+    # refer to the attributes by the declared names: names from the schema extractor may differ
+    src_attr_names = [attr_name for attr_name, _data_type in _fetch_table_info(src_con, table_name)]
+    dst_attr_names = [attr_name for attr_name, _data_type in _fetch_table_info(dst_con, table_name)]
+
+    src_schema_name = _get_src_schema_name(src_con, dst_con)
+    with _open_src_schema(src_con, dst_con, src_schema_name):
+        _copy_records(
+            src_con,
+            dst_con,
+            src_schema_name,
+            table_name,
+            src_attr_names,
+            table_name,
+            dst_attr_names,
+        )
+        if index_attrs:
+            dst_con.create_index_list(table_name, AttrList.sanitize(index_attrs))
 
     return True
+
+
+def _get_src_schema_name(src_con: "SimpleSQLite", dst_con: "SimpleSQLite") -> Optional[str]:
+    """
+    :return:
+        Schema name to refer the source database from the destination connection:
+        ``main`` if both connections are to the same database.
+        |None| if the source database cannot be accessed from the destination connection.
+    """
+
+    from .core import MEMORY_DB_NAME
+
+    if src_con.connection is not None and src_con.connection is dst_con.connection:
+        return "main"
+
+    src_db_path = src_con.database_path
+    dst_db_path = dst_con.database_path
+
+    # an in-memory source database is private to its connection and cannot be attached,
+    # whereas an in-memory destination database can attach a source database file
+    if src_db_path in (None, MEMORY_DB_NAME) or dst_db_path is None:
+        return None
+
+    # uncommitted changes of the source database are not visible from the destination
+    if src_con.connection and src_con.connection.in_transaction:
+        return None
+
+    if src_db_path == dst_db_path:
+        return "main"
+
+    return _SRC_SCHEMA_NAME
+
+
+def _copy_records(
+    src_con: "SimpleSQLite",
+    dst_con: "SimpleSQLite",
+    src_schema_name: Optional[str],
+    src_table_name: str,
+    src_attr_names: Sequence[str],
+    dst_table_name: str,
+    dst_attr_names: Sequence[str],
+) -> None:
+    """
+    Copy records of a source table to a destination table as they are stored.
+    Records are copied with an ``INSERT INTO ... SELECT`` query executed by
+    the destination connection if the source database can be accessed from it.
+    Otherwise, records are fetched from the source table by chunks of
+    ``FETCH_CHUNK_SIZE`` records to bound the memory usage.
+    Both ways result in the same records.
+    """
+
+    insert_query = _make_insert_query(dst_table_name, dst_attr_names)
+
+    if src_schema_name:
+        dst_con.execute_query(
+            "{:s} SELECT {:s} FROM {:s}.{:s}".format(
+                insert_query,
+                ",".join(map(_quote_identifier, src_attr_names)),
+                src_schema_name,
+                _quote_identifier(src_table_name),
+            )
+        )
+        return
+
+    assert src_con.connection and dst_con.connection  # to avoid type check error
+
+    src_cursor = src_con.connection.cursor()
+    src_cursor.row_factory = None  # independent of row_factory of the connection
+    src_cursor.execute(
+        "SELECT {:s} FROM {:s}".format(
+            ",".join(map(_quote_identifier, src_attr_names)), _quote_identifier(src_table_name)
+        )
+    )
+    insert_query += " VALUES ({:s})".format(",".join(["?"] * len(dst_attr_names)))
+
+    while True:
+        records = src_cursor.fetchmany(FETCH_CHUNK_SIZE)
+        if not records:
+            break
+
+        try:
+            dst_con.connection.executemany(insert_query, records)
+        except (sqlite3.OperationalError, sqlite3.IntegrityError) as e:
+            raise OperationalError(
+                message="\n".join(
+                    [
+                        "failed to copy records",
+                        f"  - query: {insert_query}",
+                        f"  - msg:   {e}",
+                        f"  - db:    {dst_con.database_path}",
+                    ]
+                )
+            ) from e
+
+
+def _fetch_table_info(con: "SimpleSQLite", table_name: str) -> list[tuple[str, str]]:
+    """
+    :return: Pairs of the name and the declared type of each attribute, exactly as declared.
+    """
+
+    assert con.connection  # to avoid type check error
+
+    cursor = con.connection.cursor()
+    cursor.row_factory = None  # independent of row_factory of the connection
+    cursor.execute(f"PRAGMA table_info({_quote_identifier(table_name)})")
+
+    return [(row[1], row[2]) for row in cursor.fetchall()]
+
+
+def _verify_records_existence(con: "SimpleSQLite", table_name: str) -> None:
+    """
+    :raises ValueError: If the table has no records, as tables are not created from empty data.
+    """
+
+    result = con.select(select="1", table_name=table_name, extra="LIMIT 1")
+    if result is None or result.fetchone() is None:
+        raise ValueError(f"input table is empty: {table_name}")
+
+
+def _make_insert_query(dst_table_name: str, dst_attr_names: Sequence[str]) -> str:
+    from .query import Table
+
+    # attribute names are quoted as they are: Attr/AttrList sanitize names,
+    # which no longer refer to the actual attributes of the tables
+    return "INSERT INTO {:s}({:s})".format(
+        Table(dst_table_name), ",".join(map(_quote_identifier, dst_attr_names))
+    )
+
+
+def _quote_identifier(name: str) -> str:
+    return '"{:s}"'.format(name.replace('"', '""'))
+
+
+@contextmanager
+def _open_src_schema(
+    src_con: "SimpleSQLite", dst_con: "SimpleSQLite", src_schema_name: Optional[str]
+) -> Iterator[None]:
+    """
+    Make the source database accessible from the destination connection as ``src_schema_name``
+    during the context, unless the ``src_schema_name`` is |None|.
+    Changes made within the context are committed at the end of it,
+    or rolled back if an exception raised.
+    """
+
+    # ATTACH/DETACH cannot be executed within a transaction
+    dst_con.commit()
+    assert dst_con.connection
+    is_attach = src_schema_name == _SRC_SCHEMA_NAME
+    if is_attach:
+        dst_con.connection.execute(
+            f"ATTACH DATABASE ? AS {_SRC_SCHEMA_NAME}", (src_con.database_path,)
+        )
+
+    try:
+        yield
+        dst_con.commit()
+    except Exception:
+        dst_con.rollback()
+        raise
+    finally:
+        if is_attach:
+            dst_con.execute_query(f"DETACH DATABASE {_SRC_SCHEMA_NAME}")
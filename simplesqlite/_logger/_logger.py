@@ -2,7 +2,9 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-from typing import Final
+import functools
+from types import ModuleType
+from typing import Final, Optional
 
 import sqliteschema
 import tabledata
@@ -33,14 +35,28 @@ def set_logger(is_enable: bool, propagation_depth: int = 2) -> None:
     tabledata.set_logger(is_enable, propagation_depth - 1)
     sqliteschema.set_logger(is_enable, propagation_depth - 1)
 
-    try:
-        import pytablereader
+    pytablereader = _import_pytablereader()
+    if pytablereader is None:
+        return
 
+    try:
         pytablereader.set_logger(is_enable, propagation_depth - 1)
-    except (ImportError, TypeError):
+    except TypeError:
         pass
 
 
+@functools.lru_cache(maxsize=None)
+def _import_pytablereader() -> Optional[ModuleType]:
+    # pytablereader is optional: memoize the result to avoid retrying a failed import,
+    # which searches the import paths at each attempt
+    try:
+        import pytablereader
+    except ImportError:
+        return None
+
+    return pytablereader
+
+
 def set_log_level(log_level):  # type: ignore
     # deprecated
     logger.disable(MODULE_NAME)
@@ -2,7 +2,7 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-from collections import Counter
+from collections import Counter, defaultdict
 from collections.abc import Sequence
 from typing import Final, Optional
 
@@ -66,6 +66,7 @@ class SQLiteTableDataSanitizer(AbstractTableDataNormalizer):
                 header = str(header).upper()
 
             self.__upper_headers.append(header)
+        self.__upper_header_set = frozenset(self.__upper_headers)
 
         self.__dup_col_handler = dup_col_handler
         self.__is_type_inference = is_type_inference
@@ -110,6 +111,10 @@ class SQLiteTableDataSanitizer(AbstractTableDataNormalizer):
         return self.__RENAME_TEMPLATE.format(table_name)
 
     def _preprocess_header(self, col_idx: int, header: Optional[str]) -> str:
+        if type(header) is str and header.isascii() and header.strip():
+            # the most common case: a non-blank ASCII string is never a multibyte string
+            return Attr.sanitize(header)
+
         if typepy.is_null_string(header):
             return self.__get_default_header(col_idx)
 
@@ -162,24 +167,33 @@ class SQLiteTableDataSanitizer(AbstractTableDataNormalizer):
                 raise
 
         # duplicated attribute name handling ---
-        for key, count in Counter(attr_name_list).most_common():
-            if count <= 1:
-                continue
-
-            if self.__dup_col_handler == "error":
-                raise ValueError(f"duplicate column name: {key}")
-
+        attr_name_counter = Counter(attr_name_list)
+        dup_keys = [key for key, count in attr_name_counter.items() if count > 1]
+        if not dup_keys:
+            return attr_name_list
+
+        if self.__dup_col_handler == "error":
+            # report the most duplicated key as most_common() did: the first one of them if tied
+            dup_key = max(dup_keys, key=attr_name_counter.__getitem__)
+            raise ValueError(f"duplicate column name: {dup_key}")
+
+        attr_idxs_map: dict[str, list[int]] = defaultdict(list)
+        for i, attr in enumerate(attr_name_list):
+            attr_idxs_map[attr].append(i)
+        attr_name_set = set(attr_name_list)
+
+        for key in dup_keys:
             # rename duplicate headers
-            rename_target_idx_list = [i for i, attr in enumerate(attr_name_list) if attr == key][1:]
             suffix_count = 0
-            for rename_target_idx in rename_target_idx_list:
+            for rename_target_idx in attr_idxs_map[key][1:]:
                 while True:
                     suffix_count += 1
                     attr_name_candidate = f"{key:s}_{suffix_count:d}"
-                    if attr_name_candidate in attr_name_list:
+                    if attr_name_candidate in attr_name_set:
                         continue
 
                     attr_name_list[rename_target_idx] = attr_name_candidate
+                    attr_name_set.add(attr_name_candidate)
                     break
 
         return attr_name_list
@@ -191,7 +205,7 @@ class SQLiteTableDataSanitizer(AbstractTableDataNormalizer):
         i = 0
         while True:
             header = convert_idx_to_alphabet(col_idx + i)
-            if header not in self.__upper_headers:
+            if header not in self.__upper_header_set:
                 return header
 
             i += 1
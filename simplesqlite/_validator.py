@@ -5,138 +5,142 @@ from pathvalidate import unprintable_ascii_chars
 from pathvalidate.error import ErrorReason, ValidationError
 
 
-__SQLITE_VALID_RESERVED_KEYWORDS: Final = [
-    "ABORT",
-    "ACTION",
-    "AFTER",
-    "ANALYZE",
-    "ASC",
-    "ATTACH",
-    "BEFORE",
-    "BEGIN",
-    "BY",
-    "CASCADE",
-    "CAST",
-    "COLUMN",
-    "CONFLICT",
-    "CROSS",
-    "CURRENT_DATE",
-    "CURRENT_TIME",
-    "CURRENT_TIMESTAMP",
-    "DATABASE",
-    "DEFERRED",
-    "DESC",
-    "DETACH",
-    "EACH",
-    "END",
-    "EXCLUSIVE",
-    "EXPLAIN",
-    "FAIL",
-    "FOR",
-    "FULL",
-    "GLOB",
-    "IGNORE",
-    "IMMEDIATE",
-    "INDEXED",
-    "INITIALLY",
-    "INNER",
-    "INSTEAD",
-    "KEY",
-    "LEFT",
-    "LIKE",
-    "MATCH",
-    "NATURAL",
-    "NO",
-    "OF",
-    "OFFSET",
-    "OUTER",
-    "PLAN",
-    "PRAGMA",
-    "QUERY",
-    "RAISE",
-    "RECURSIVE",
-    "REGEXP",
-    "REINDEX",
-    "RELEASE",
-    "RENAME",
-    "REPLACE",
-    "RESTRICT",
-    "RIGHT",
-    "ROLLBACK",
-    "ROW",
-    "SAVEPOINT",
-    "TEMP",
-    "TEMPORARY",
-    "TRIGGER",
-    "VACUUM",
-    "VIEW",
-    "VIRTUAL",
-    "WITH",
-    "WITHOUT",
-]
-__SQLITE_INVALID_RESERVED_KEYWORDS: Final = [
-    "ADD",
-    "ALL",
-    "ALTER",
-    "AND",
-    "AS",
-    "AUTOINCREMENT",
-    "BETWEEN",
-    "CASE",
-    "CHECK",
-    "COLLATE",
-    "COMMIT",
-    "CONSTRAINT",
-    "CREATE",
-    "DEFAULT",
-    "DEFERRABLE",
-    "DELETE",
-    "DISTINCT",
-    "DROP",
-    "ELSE",
-    "ESCAPE",
-    "EXCEPT",
-    "EXISTS",
-    "FOREIGN",
-    "FROM",
-    "GROUP",
-    "HAVING",
-    "IN",
-    "INDEX",
-    "INSERT",
-    "INTERSECT",
-    "INTO",
-    "IS",
-    "ISNULL",
-    "JOIN",
-    "LIMIT",
-    "NOT",
-    "NOTNULL",
-    "NULL",
-    "ON",
-    "OR",
-    "ORDER",
-    "PRIMARY",
-    "REFERENCES",
-    "SELECT",
-    "SET",
-    "TABLE",
-    "THEN",
-    "TO",
-    "TRANSACTION",
-    "UNION",
-    "UNIQUE",
-    "UPDATE",
-    "USING",
-    "VALUES",
-    "WHEN",
-    "WHERE",
-]
+__SQLITE_VALID_RESERVED_KEYWORDS: Final = frozenset(
+    {
+        "ABORT",
+        "ACTION",
+        "AFTER",
+        "ANALYZE",
+        "ASC",
+        "ATTACH",
+        "BEFORE",
+        "BEGIN",
+        "BY",
+        "CASCADE",
+        "CAST",
+        "COLUMN",
+        "CONFLICT",
+        "CROSS",
+        "CURRENT_DATE",
+        "CURRENT_TIME",
+        "CURRENT_TIMESTAMP",
+        "DATABASE",
+        "DEFERRED",
+        "DESC",
+        "DETACH",
+        "EACH",
+        "END",
+        "EXCLUSIVE",
+        "EXPLAIN",
+        "FAIL",
+        "FOR",
+        "FULL",
+        "GLOB",
+        "IGNORE",
+        "IMMEDIATE",
+        "INDEXED",
+        "INITIALLY",
+        "INNER",
+        "INSTEAD",
+        "KEY",
+        "LEFT",
+        "LIKE",
+        "MATCH",
+        "NATURAL",
+        "NO",
+        "OF",
+        "OFFSET",
+        "OUTER",
+        "PLAN",
+        "PRAGMA",
+        "QUERY",
+        "RAISE",
+        "RECURSIVE",
+        "REGEXP",
+        "REINDEX",
+        "RELEASE",
+        "RENAME",
+        "REPLACE",
+        "RESTRICT",
+        "RIGHT",
+        "ROLLBACK",
+        "ROW",
+        "SAVEPOINT",
+        "TEMP",
+        "TEMPORARY",
+        "TRIGGER",
+        "VACUUM",
+        "VIEW",
+        "VIRTUAL",
+        "WITH",
+        "WITHOUT",
+    }
+)
+__SQLITE_INVALID_RESERVED_KEYWORDS: Final = frozenset(
+    {
+        "ADD",
+        "ALL",
+        "ALTER",
+        "AND",
+        "AS",
+        "AUTOINCREMENT",
+        "BETWEEN",
+        "CASE",
+        "CHECK",
+        "COLLATE",
+        "COMMIT",
+        "CONSTRAINT",
+        "CREATE",
+        "DEFAULT",
+        "DEFERRABLE",
+        "DELETE",
+        "DISTINCT",
+        "DROP",
+        "ELSE",
+        "ESCAPE",
+        "EXCEPT",
+        "EXISTS",
+        "FOREIGN",
+        "FROM",
+        "GROUP",
+        "HAVING",
+        "IN",
+        "INDEX",
+        "INSERT",
+        "INTERSECT",
+        "INTO",
+        "IS",
+        "ISNULL",
+        "JOIN",
+        "LIMIT",
+        "NOT",
+        "NOTNULL",
+        "NULL",
+        "ON",
+        "OR",
+        "ORDER",
+        "PRIMARY",
+        "REFERENCES",
+        "SELECT",
+        "SET",
+        "TABLE",
+        "THEN",
+        "TO",
+        "TRANSACTION",
+        "UNION",
+        "UNIQUE",
+        "UPDATE",
+        "USING",
+        "VALUES",
+        "WHEN",
+        "WHERE",
+    }
+)
 
 __SQLITE_VALID_RESERVED_KEYWORDS_TABLE: Final = __SQLITE_VALID_RESERVED_KEYWORDS
-__SQLITE_INVALID_RESERVED_KEYWORDS_TABLE: Final = __SQLITE_INVALID_RESERVED_KEYWORDS + ["IF"]
+__SQLITE_INVALID_RESERVED_KEYWORDS_TABLE: Final = __SQLITE_INVALID_RESERVED_KEYWORDS | {"IF"}
 
-__SQLITE_VALID_RESERVED_KEYWORDS_ATTR: Final = __SQLITE_VALID_RESERVED_KEYWORDS + ["IF"]
+__SQLITE_VALID_RESERVED_KEYWORDS_ATTR: Final = __SQLITE_VALID_RESERVED_KEYWORDS | {"IF"}
 __SQLITE_INVALID_RESERVED_KEYWORDS_ATTR: Final = __SQLITE_INVALID_RESERVED_KEYWORDS
 
 __RE_INVALID_CHARS: Final = re.compile(
@@ -152,27 +156,9 @@ def validate_sqlite_table_name(name: str) -> None:
         - |raises_sqlite_keywords|
     """
 
-    if not name:
-        raise ValidationError(["null name"], reason=ErrorReason.NULL_NAME)
-
-    if __RE_INVALID_CHARS.search(name):
-        raise ValidationError(["unprintable character found"], reason=ErrorReason.INVALID_CHARACTER)
-
-    name = name.upper()
-
-    if name in __SQLITE_INVALID_RESERVED_KEYWORDS_TABLE:
-        raise ValidationError(
-            [f"'{name}' is a reserved keyword by sqlite"],
-            reason=ErrorReason.RESERVED_NAME,
-            reusable_name=False,
-        )
-
-    if name in __SQLITE_VALID_RESERVED_KEYWORDS_TABLE:
-        raise ValidationError(
-            [f"'{name}' is a reserved keyword by sqlite"],
-            reason=ErrorReason.RESERVED_NAME,
-            reusable_name=True,
-        )
+    __validate_sqlite_name(
+        name, __SQLITE_INVALID_RESERVED_KEYWORDS_TABLE, __SQLITE_VALID_RESERVED_KEYWORDS_TABLE
+    )
 
 
 def validate_sqlite_attr_name(name: str) -> None:
@@ -183,6 +169,14 @@ def validate_sqlite_attr_name(name: str) -> None:
         - |raises_sqlite_keywords|
     """
 
+    __validate_sqlite_name(
+        name, __SQLITE_INVALID_RESERVED_KEYWORDS_ATTR, __SQLITE_VALID_RESERVED_KEYWORDS_ATTR
+    )
+
+
+def __validate_sqlite_name(
+    name: str, invalid_keywords: frozenset[str], valid_keywords: frozenset[str]
+) -> None:
     if not name:
         raise ValidationError(["null name"], reason=ErrorReason.NULL_NAME)
 
@@ -191,14 +185,14 @@ def validate_sqlite_attr_name(name: str) -> None:
 
     name = name.upper()
 
-    if name in __SQLITE_INVALID_RESERVED_KEYWORDS_ATTR:
+    if name in invalid_keywords:
         raise ValidationError(
             [f"'{name}' is a reserved keyword by sqlite"],
             reason=ErrorReason.RESERVED_NAME,
             reusable_name=False,
         )
 
-    if name in __SQLITE_VALID_RESERVED_KEYWORDS_ATTR:
+    if name in valid_keywords:
         raise ValidationError(
             [f"'{name}' is a reserved keyword by sqlite"],
             reason=ErrorReason.RESERVED_NAME,
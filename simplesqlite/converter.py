@@ -5,12 +5,20 @@
 from collections.abc import Sequence
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Callable, Union
+from typing import Any, Callable, Final, Union
 
 from ._logger import logger
 
 
+# types of values that can be passed to sqlite3 as they are
+_PASS_THROUGH_TYPES: Final = frozenset([str, float, bytes, type(None)])
+
+
 def default_datetime_converter(value: datetime) -> str:
+    if value.tzinfo is None and value.year >= 1000:
+        # equivalent to the strftime below for naive datetimes, and faster
+        return value.isoformat(" ", "seconds")
+
     return value.strftime("%Y-%m-%d %H:%M:%S%z")
 
 
@@ -19,9 +27,6 @@ class RecordConvertor:
     def __to_sqlite_element(
         value: Any, attr: Union[int, str], datetime_converter: Callable[[datetime], str]
     ) -> Any:
-        if isinstance(value, Decimal):
-            return float(value)
-
         if isinstance(value, int):
             # INTEGER. The value is a signed integer,
             # stored in 1, 2, 3, 4, 6, or 8 bytes depending on the magnitude of the value.
@@ -29,12 +34,76 @@ class RecordConvertor:
             if not (-9223372036854775808 < value < 9223372036854775807):
                 raise OverflowError(attr)
 
+            return value
+
+        if isinstance(value, Decimal):
+            return float(value)
+
         if isinstance(value, datetime):
             # TODO: add an interface to specify datetime_converter
             return datetime_converter(value)
 
         return value
 
+    @classmethod
+    def __from_dict(
+        cls, attr_names: Sequence[str], values: dict, datetime_converter: Callable[[datetime], str]
+    ) -> list:
+        to_sqlite_element = cls.__to_sqlite_element
+
+        return [
+            value
+            if type(value) in _PASS_THROUGH_TYPES
+            else to_sqlite_element(value, attr_name, datetime_converter)
+            for attr_name, value in zip(attr_names, map(values.get, attr_names))
+        ]
+
+    @classmethod
+    def __from_namedtuple(
+        cls, attr_names: Sequence[str], values: Any, datetime_converter: Callable[[datetime], str]
+    ) -> list:
+        return cls.__from_dict(attr_names, values._asdict(), datetime_converter)
+
+    @classmethod
+    def __from_sequence(
+        cls,
+        attr_names: Sequence[str],
+        values: Sequence,
+        datetime_converter: Callable[[datetime], str],
+    ) -> list:
+        to_sqlite_element = cls.__to_sqlite_element
+
+        # values that need no conversion skip the call of __to_sqlite_element
+        return [
+            value
+            if type(value) in _PASS_THROUGH_TYPES
+            else to_sqlite_element(value, col, datetime_converter)
+            for col, value in enumerate(values)
+        ]
+
+    @classmethod
+    def __get_record_maker(cls, values: Any) -> Callable[..., list]:
+        """
+        Resolve a function that converts ``values`` to a record.
+        The result depends only on the type of ``values``.
+        """
+
+        if type(values) is list:
+            # the most common case: skip the attribute lookup of _asdict
+            return cls.__from_sequence
+
+        if hasattr(values, "_asdict"):
+            # from a namedtuple to a dict
+            return cls.__from_namedtuple
+
+        if isinstance(values, dict):
+            return cls.__from_dict
+
+        if isinstance(values, (tuple, list)):
+            return cls.__from_sequence
+
+        raise TypeError(f"cannot convert from {type(values)} to list")
+
     @classmethod
     def to_record(cls, attr_names: Sequence[str], values: Union[Sequence, dict]) -> list:
         """
@@ -47,27 +116,7 @@ class RecordConvertor:
         :raises ValueError: If the ``values`` is invalid.
         """
 
-        try:
-            # from a namedtuple to a dict
-            values = values._asdict()  # type: ignore
-        except AttributeError:
-            pass
-
-        datetime_converter = default_datetime_converter
-
-        if isinstance(values, dict):
-            return [
-                cls.__to_sqlite_element(values.get(attr_name), attr_name, datetime_converter)
-                for attr_name in attr_names
-            ]
-
-        if isinstance(values, (tuple, list)):
-            return [
-                cls.__to_sqlite_element(value, col, datetime_converter)
-                for col, value in enumerate(values)
-            ]
-
-        raise TypeError(f"cannot convert from {type(values)} to list")
+        return cls.__get_record_maker(values)(attr_names, values, default_datetime_converter)
 
     @classmethod
     def to_records(cls, attr_names: Sequence[str], value_matrix: Sequence) -> list:
@@ -84,10 +133,18 @@ class RecordConvertor:
 
         records = []
         error_msgs = []
+        record_makers: dict[type, Callable[..., list]] = {}
+        datetime_converter = default_datetime_converter
 
         for row_idx, record in enumerate(value_matrix):
+            # resolve the conversion once for each type of records in the matrix
+            record_type = type(record)
+            make_record = record_makers.get(record_type)
+            if make_record is None:
+                make_record = record_makers[record_type] = cls.__get_record_maker(record)
+
             try:
-                records.append(cls.to_record(attr_names, record))
+                records.append(make_record(attr_names, record, datetime_converter))
             except OverflowError as e:
                 try:
                     if isinstance(e.args[0], int):
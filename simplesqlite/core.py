@@ -2,12 +2,15 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import functools
 import logging
 import os
 import re
 import sqlite3
+import time
 from collections import OrderedDict, defaultdict
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from itertools import chain
 from sqlite3 import Connection, Cursor
 from typing import TYPE_CHECKING, Any, Callable, Final, Optional, Union, cast
 
@@ -15,7 +18,7 @@ import pathvalidate
 import typepy
 from dataproperty.typing import TypeHint
 from mbstrdecoder import MultiByteStrDecoder
-from sqliteschema import SQLITE_SYSTEM_TABLES, SQLiteSchemaExtractor
+from sqliteschema import SQLITE_SYSTEM_TABLES, SQLiteSchemaExtractor, SQLiteTableSchema
 from tabledata import TableData
 from typepy import extract_typepy_from_dtype
 
@@ -35,7 +38,6 @@ from .error import (
 from .query import (
     Attr,
     AttrList,
-    Insert,
     InsertMany,
     QueryItem,
     Select,
@@ -54,6 +56,24 @@ if TYPE_CHECKING:
 
 MEMORY_DB_NAME: Final = ":memory:"
 
+# default maximum number of host parameters in a single query of SQLite before 3.32.0
+_MAX_QUERY_PARAMS: Final = 999
+
+# types of values that are bound to a query as they are:
+# values of the other types are stored as the text of the values, such as "True" for True
+_BINDABLE_TYPES: Final = frozenset([str, int, float, bytes, type(None)])
+
+_typecode_to_sqlitetype: Final = {
+    typepy.Typecode.INTEGER: "INTEGER",
+    typepy.Typecode.REAL_NUMBER: "REAL",
+    typepy.Typecode.STRING: "TEXT",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_insert_query(table_name: str, attr_names: tuple[str, ...], num_records: int = 1) -> str:
+    return InsertMany(table_name, AttrList(attr_names), num_records=num_records).to_query()
+
 
 class SimpleSQLite:
     """
@@ -85,6 +105,8 @@ class SimpleSQLite:
     dup_col_handler = "error"
     global_debug_query = False
 
+    __RE_ATTR_DEFS: Final = re.compile("[(].*[)]")
+
     @property
     def database_path(self) -> Optional[str]:
         """
@@ -150,7 +172,16 @@ class SimpleSQLite:
         self.__delayed_connection_path: Optional[str] = None
 
         self.__dict_query_count: dict[str, int] = defaultdict(int)
-        self.__dict_query_totalexectime: dict[str, float] = defaultdict(float)
+        self.__dict_query_totalexectime_ns: dict[str, int] = defaultdict(int)
+
+        self.__schema_version: Optional[int] = None
+        self.__table_names_cache: dict[tuple[bool, bool], list[str]] = {}
+        self.__attr_names_cache: dict[str, list[str]] = {}
+        self.__table_schema_cache: dict[str, SQLiteTableSchema] = {}
+        self.__table_metadata_cache: dict[
+            str, tuple[Optional[str], tuple[str, ...], Mapping[str, TypeHint]]
+        ] = {}
+        self.__insert_cursor: Optional[Cursor] = None
 
     def __init__(
         self,
@@ -278,7 +309,7 @@ class SimpleSQLite:
 
         self.close()
 
-        logger.debug(f"connect to a SQLite database: path='{database_path}', mode={mode}")
+        logger.debug("connect to a SQLite database: path='{}', mode={}", database_path, mode)
 
         if mode == "r":
             self.__verify_db_file_existence(database_path)
@@ -319,8 +350,9 @@ class SimpleSQLite:
 
         :param query: Query to executed.
         :param tuple caller:
-            Caller information.
+            Caller information that used in an error message.
             Expects the return value of :py:meth:`logging.Logger.findCaller`.
+            Defaults to the caller of this method.
         :return: The result of the query execution.
         :rtype: sqlite3.Cursor
         :raises simplesqlite.NullDatabaseConnectionError:
@@ -332,24 +364,25 @@ class SimpleSQLite:
             i.e. No access permissions check by |attr_mode|.
         """
 
-        import time
-
         self.check_connection()
         if typepy.is_null_string(query):
             return None
 
+        query_str = query if isinstance(query, str) else str(query)
+
         if self.debug_query or self.global_debug_query:
-            logger.debug(query)
+            logger.debug(query_str)
 
-        exec_start_time = time.time()
+        exec_start_time = time.perf_counter_ns() if self.__is_profile else 0
 
         assert self.connection  # to avoid type check error
 
         try:
-            result = self.connection.execute(str(query))
+            result = self.connection.execute(query_str)
         except (sqlite3.OperationalError, sqlite3.IntegrityError) as e:
             if caller is None:
-                caller = logging.getLogger().findCaller()
+                # the caller information is only needed in the error path
+                caller = logging.getLogger().findCaller(stacklevel=2)
             file_path, line_no, func_name = caller[:3]
 
             raise OperationalError(
@@ -358,7 +391,7 @@ class SimpleSQLite:
                         "failed to execute query at {:s}({:d}) {:s}".format(
                             file_path, line_no, func_name
                         ),
-                        f"  - query: {MultiByteStrDecoder(query).unicode_str}",
+                        f"  - query: {MultiByteStrDecoder(query_str).unicode_str}",
                         f"  - msg:   {e}",
                         f"  - db:    {self.database_path}",
                     ]
@@ -366,10 +399,7 @@ class SimpleSQLite:
             )
 
         if self.__is_profile:
-            self.__dict_query_count[str(query)] += 1
-
-            elapse_time = time.time() - exec_start_time
-            self.__dict_query_totalexectime[str(query)] += elapse_time
+            self.__update_profile(query_str, exec_start_time)
 
         return result
 
@@ -407,10 +437,7 @@ class SimpleSQLite:
 
         self.verify_table_existence(table_name)
 
-        return self.execute_query(
-            str(Select(select, table_name, where, extra)),
-            logging.getLogger().findCaller(),
-        )
+        return self.execute_query(str(Select(select, table_name, where, extra)))
 
     def select_as_dataframe(
         self,
@@ -563,7 +590,7 @@ class SimpleSQLite:
         :raises simplesqlite.OperationalError: |raises_operational_error|
         """
 
-        table_schema = self.schema_extractor.fetch_table_schema(table_name)
+        table_schema = self._fetch_table_schema(table_name)
 
         memdb = connect_memdb(max_workers=self.__max_workers)
         memdb.create_table_from_tabledata(
@@ -597,11 +624,24 @@ class SimpleSQLite:
 
         if attr_names is None:
             attr_names = self.fetch_attr_names(table_name)
-        values = RecordConvertor.to_record(attr_names, record)
-        query = Insert(table_name, AttrList(attr_names), values).to_query()
+        values = [
+            value if type(value) in _BINDABLE_TYPES else str(value)
+            for value in RecordConvertor.to_record(attr_names, record)
+        ]
+        query = _make_insert_query(table_name, tuple(attr_names))
 
-        if self.execute_query(query, logging.getLogger().findCaller()) is None:
-            return False
+        if self.debug_query or self.global_debug_query:
+            logger.debug("{}\n    record: {}", query, values)
+
+        exec_start_time = time.perf_counter_ns() if self.__is_profile else 0
+
+        try:
+            self.__get_insert_cursor().execute(query, values)
+        except (sqlite3.OperationalError, sqlite3.IntegrityError, sqlite3.ProgrammingError) as e:
+            raise self.__make_insert_error(query, e, [values])
+
+        if self.__is_profile:
+            self.__update_profile(query, exec_start_time)
 
         return True
 
@@ -635,16 +675,13 @@ class SimpleSQLite:
 
         if attr_names:
             logger.debug(
-                "insert {number} records into {table}({attrs})".format(
-                    number=len(records) if records else 0, table=table_name, attrs=attr_names
-                )
+                "insert {} records into {}({})",
+                len(records) if records else 0,
+                table_name,
+                attr_names,
             )
         else:
-            logger.debug(
-                "insert {number} records into {table}".format(
-                    number=len(records) if records else 0, table=table_name
-                )
-            )
+            logger.debug("insert {} records into {}", len(records) if records else 0, table_name)
 
         if typepy.is_empty_sequence(records):
             return 0
@@ -652,7 +689,7 @@ class SimpleSQLite:
         if attr_names is None:
             attr_names = self.fetch_attr_names(table_name)
         records = RecordConvertor.to_records(attr_names, records)
-        query = InsertMany(table_name, AttrList(attr_names)).to_query()
+        query = _make_insert_query(table_name, tuple(attr_names))
 
         if self.debug_query or self.global_debug_query:
             logging_count = 8
@@ -666,20 +703,10 @@ class SimpleSQLite:
 
             logger.debug("\n".join(logs))
 
-        assert self.connection  # to avoid type check error
-
         try:
-            self.connection.executemany(query, records)
-        except (sqlite3.OperationalError, sqlite3.IntegrityError) as e:
-            caller = logging.getLogger().findCaller()
-            file_path, line_no, func_name = caller[:3]
-            raise OperationalError(
-                f"{file_path:s}({line_no:d}) {func_name:s}: failed to execute query:\n"
-                + f"  query={query}\n"
-                + f"  msg='{e}'\n"
-                + f"  db={self.database_path}\n"
-                + f"  records={records[:2]}\n"
-            )
+            self.__execute_insert_many(table_name, attr_names, query, records)
+        except (sqlite3.OperationalError, sqlite3.IntegrityError, sqlite3.ProgrammingError) as e:
+            raise self.__make_insert_error(query, e, records)
 
         return len(records)
 
@@ -716,7 +743,7 @@ class SimpleSQLite:
 
         query = SqlQuery.make_update(table_name, set_query, where)
 
-        return self.execute_query(query, logging.getLogger().findCaller())
+        return self.execute_query(query)
 
     def delete(self, table_name: str, where: Optional[WhereQuery] = None) -> Optional[Cursor]:
         """
@@ -734,7 +761,7 @@ class SimpleSQLite:
         if where:
             query += f" WHERE {where:s}"
 
-        return self.execute_query(query, logging.getLogger().findCaller())
+        return self.execute_query(query)
 
     def fetch_value(
         self,
@@ -763,9 +790,7 @@ class SimpleSQLite:
             logger.debug(e)
             return None
 
-        result = self.execute_query(
-            Select(select, table_name, where, extra), logging.getLogger().findCaller()
-        )
+        result = self.execute_query(Select(select, table_name, where, extra))
         if result is None:
             return None
 
@@ -816,10 +841,15 @@ class SimpleSQLite:
         """
 
         self.check_connection()
+        self.__validate_schema_cache()
 
-        return self.schema_extractor.fetch_table_names(
-            include_system_table=include_system_table, include_view=include_view
-        )
+        cache_key = (include_system_table, include_view)
+        if cache_key not in self.__table_names_cache:
+            self.__table_names_cache[cache_key] = self.schema_extractor.fetch_table_names(
+                include_system_table=include_system_table, include_view=include_view
+            )
+
+        return list(self.__table_names_cache[cache_key])
 
     def fetch_view_names(self) -> list[str]:
         """
@@ -867,8 +897,14 @@ class SimpleSQLite:
         """
 
         self.verify_table_existence(table_name)
+        self.__validate_schema_cache()
+
+        if table_name not in self.__attr_names_cache:
+            self.__attr_names_cache[table_name] = self._fetch_table_schema(
+                table_name
+            ).get_attr_names()
 
-        return self.schema_extractor.fetch_table_schema(table_name).get_attr_names()
+        return list(self.__attr_names_cache[table_name])
 
     def fetch_attr_type(self, table_name: str) -> dict[str, str]:
         """
@@ -891,7 +927,7 @@ class SimpleSQLite:
         )
         assert result  # to avoid type check error
         query = result.fetchone()[0]
-        match = re.search("[(].*[)]", query)
+        match = self.__RE_ATTR_DEFS.search(query)
         assert match  # to avoid type check error
 
         def get_entry(items: list[str]) -> list[str]:
@@ -921,9 +957,41 @@ class SimpleSQLite:
         return self.fetch_value(select="COUNT(*)", table_name=table_name, where=where)
 
     def fetch_data_types(self, table_name: str) -> dict[str, TypeHint]:
-        _, _, type_hints = extract_table_metadata(self, table_name)
+        _, _, type_hints = self._extract_table_metadata(table_name)
 
-        return type_hints
+        return dict(type_hints)
+
+    def _fetch_table_schema(self, table_name: str) -> SQLiteTableSchema:
+        """
+        Memoized version of :py:meth:`sqliteschema.SQLiteSchemaExtractor.fetch_table_schema`.
+        The returned schema is shared with the cache and must not be modified.
+        """
+
+        self.check_connection()
+        self.__validate_schema_cache()
+
+        if table_name not in self.__table_schema_cache:
+            self.__table_schema_cache[table_name] = self.schema_extractor.fetch_table_schema(
+                table_name
+            )
+
+        return self.__table_schema_cache[table_name]
+
+    def _extract_table_metadata(
+        self, table_name: str
+    ) -> tuple[Optional[str], tuple[str, ...], Mapping[str, TypeHint]]:
+        """
+        Memoized version of :py:func:`simplesqlite._common.extract_table_metadata`.
+        The returned values are shared with the cache: they are immutable.
+        """
+
+        self.check_connection()
+        self.__validate_schema_cache()
+
+        if table_name not in self.__table_metadata_cache:
+            self.__table_metadata_cache[table_name] = extract_table_metadata(self, table_name)
+
+        return self.__table_metadata_cache[table_name]
 
     def get_profile(self, profile_count: int = 50) -> list[Any]:
         """
@@ -948,8 +1016,8 @@ class SimpleSQLite:
         profile_table_name = "sql_profile"
 
         value_matrix = [
-            [query, execute_time, self.__dict_query_count.get(query, 0)]
-            for query, execute_time in self.__dict_query_totalexectime.items()
+            [query, execute_time_ns / 1e9, self.__dict_query_count.get(query, 0)]
+            for query, execute_time_ns in self.__dict_query_totalexectime_ns.items()
         ]
         attr_names = ("sql_query", "cumulative_time", "count")
         con_tmp = connect_memdb(max_workers=self.__max_workers)
@@ -1062,7 +1130,17 @@ class SimpleSQLite:
         except NameValidationError:
             return False
 
-        return table_name in self.fetch_table_names(include_view=include_view)
+        if table_name in SQLITE_SYSTEM_TABLES:
+            return False
+
+        self.check_connection()
+
+        if include_view:
+            query = "SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?"
+        else:
+            query = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+
+        return self.__fetchone(query, (table_name,)) is not None
 
     def has_view(self, view_name: str) -> bool:
         """
@@ -1297,10 +1375,11 @@ class SimpleSQLite:
 
         if self.has_table(table_name, include_view=False):
             query = f"DROP TABLE IF EXISTS '{table_name:s}'"
-            self.execute_query(query, logging.getLogger().findCaller())
+            self.execute_query(query)
         elif self.has_view(table_name):
             self.execute_query(f"DROP VIEW IF EXISTS {table_name}")
 
+        self.__clear_schema_cache()
         self.commit()
 
     def create_table(self, table_name: str, attr_descriptions: Sequence[str]) -> bool:
@@ -1323,7 +1402,10 @@ class SimpleSQLite:
         )
         logger.debug(query)
 
-        if self.execute_query(query, logging.getLogger().findCaller()) is None:
+        result = self.execute_query(query)
+        self.__clear_schema_cache()
+
+        if result is None:
             return False
 
         return True
@@ -1351,7 +1433,7 @@ class SimpleSQLite:
         )
 
         logger.debug(query)
-        self.execute_query(query, logging.getLogger().findCaller())
+        self.execute_query(query)
 
     def create_index_list(self, table_name: str, attr_names: Sequence[str]) -> None:
         """
@@ -1421,6 +1503,7 @@ class SimpleSQLite:
             add_primary_key_column,
             index_attrs,
         )
+        self.commit()
 
     def create_table_from_tabledata(
         self,
@@ -1443,6 +1526,7 @@ class SimpleSQLite:
         self.__create_table_from_tabledata(
             table_data, primary_key, add_primary_key_column, index_attrs
         )
+        self.commit()
 
     def create_table_from_csv(
         self,
@@ -1504,6 +1588,7 @@ class SimpleSQLite:
                 self.__create_table_from_tabledata(
                     table_data, primary_key, add_primary_key_column, index_attrs
                 )
+            self.commit()
             return
         except (ptr.InvalidFilePathError, OSError):
             pass
@@ -1519,6 +1604,7 @@ class SimpleSQLite:
             self.__create_table_from_tabledata(
                 table_data, primary_key, add_primary_key_column, index_attrs
             )
+        self.commit()
 
     def create_table_from_json(
         self,
@@ -1557,6 +1643,7 @@ class SimpleSQLite:
                 self.__create_table_from_tabledata(
                     table_data, primary_key, add_primary_key_column, index_attrs
                 )
+            self.commit()
             return
         except (ptr.InvalidFilePathError, OSError):
             pass
@@ -1568,6 +1655,7 @@ class SimpleSQLite:
             self.__create_table_from_tabledata(
                 table_data, primary_key, add_primary_key_column, index_attrs
             )
+        self.commit()
 
     def create_table_from_dataframe(
         self,
@@ -1599,6 +1687,7 @@ class SimpleSQLite:
             add_primary_key_column,
             index_attrs,
         )
+        self.commit()
 
     def dump(self, db_path: str, mode: str = "a") -> None:
         with SimpleSQLite(db_path, mode=mode, max_workers=self.__max_workers) as dst_con:
@@ -1615,7 +1704,7 @@ class SimpleSQLite:
         except NullDatabaseConnectionError:
             return
 
-        logger.debug(f"rollback: path='{self.database_path}'")
+        logger.debug("rollback: path='{}'", self.database_path)
 
         assert self.connection  # to avoid type check error
         self.connection.rollback()
@@ -1630,7 +1719,7 @@ class SimpleSQLite:
         except NullDatabaseConnectionError:
             return
 
-        logger.debug(f"commit: path='{self.database_path}'")
+        logger.debug("commit: path='{}'", self.database_path)
         assert self.connection  # to avoid type check error
 
         try:
@@ -1654,7 +1743,7 @@ class SimpleSQLite:
         except (SystemError, NullDatabaseConnectionError):
             return
 
-        logger.debug(f"close connection to a SQLite database: path='{self.database_path}'")
+        logger.debug("close connection to a SQLite database: path='{}'", self.database_path)
 
         self.commit()
         assert self.connection  # to avoid type check error
@@ -1690,6 +1779,110 @@ class SimpleSQLite:
 
         connection.close()
 
+    def __fetchone(self, query: str, params: Sequence = ()) -> Optional[tuple]:
+        assert self.connection  # to avoid type check error
+
+        cursor = self.connection.cursor()
+        cursor.row_factory = None  # independent of row_factory of the connection
+
+        return cursor.execute(query, params).fetchone()
+
+    def __clear_schema_cache(self) -> None:
+        self.__schema_version = None
+        self.__table_names_cache.clear()
+        self.__attr_names_cache.clear()
+        self.__table_schema_cache.clear()
+        self.__table_metadata_cache.clear()
+
+    def __validate_schema_cache(self) -> None:
+        """
+        Discard cached schema information if the database schema was changed
+        since the cache was populated: the schema may also be modified by
+        arbitrary queries or by other instances that share the connection.
+        """
+
+        result = self.__fetchone("PRAGMA schema_version")
+        assert result  # to avoid type check error
+        schema_version = result[0]
+        if schema_version == self.__schema_version:
+            return
+
+        self.__clear_schema_cache()
+        self.__schema_version = schema_version
+
+    def __update_profile(self, query: str, exec_start_time: int) -> None:
+        # accumulate integer nanoseconds to avoid rounding errors of many additions
+        elapse_time_ns = time.perf_counter_ns() - exec_start_time
+        self.__dict_query_count[query] += 1
+        self.__dict_query_totalexectime_ns[query] += elapse_time_ns
+
+    def __get_insert_cursor(self) -> Cursor:
+        """
+        Return the cursor that is reused for INSERT queries to avoid creating
+        a new cursor for each call. Prepared statements are cached by the
+        connection regardless of the cursor.
+        """
+
+        if self.__insert_cursor is None:
+            assert self.connection  # to avoid type check error
+            self.__insert_cursor = self.connection.cursor()
+
+        return self.__insert_cursor
+
+    def __execute_insert_many(
+        self, table_name: str, attr_names: Sequence[str], query: str, records: Sequence[Sequence]
+    ) -> None:
+        """
+        Insert records by multi-row INSERT queries as many as the records fill them:
+        a statement step per multiple records is faster than a step per record.
+        The rest of the records are inserted by the single-row ``query``.
+
+        Records are inserted in the same manner as the single-row ``query`` on failures:
+        the records preceding the failed record are inserted (and not committed).
+        """
+
+        cursor = self.__get_insert_cursor()
+        num_attrs = len(attr_names)
+        chunk_size = _MAX_QUERY_PARAMS // num_attrs
+
+        if chunk_size > 1 and len(records) >= chunk_size:
+            num_chunked = len(records) - len(records) % chunk_size
+            chunk_query = _make_insert_query(table_name, tuple(attr_names), chunk_size)
+            start = 0
+
+            # flattening records with the wrong number of values would misalign the columns
+            if all(len(record) == num_attrs for record in records[:num_chunked]):
+                while start < num_chunked:
+                    try:
+                        cursor.execute(
+                            chunk_query,
+                            list(chain.from_iterable(records[start : start + chunk_size])),
+                        )
+                    except sqlite3.DatabaseError:
+                        # none of the records of the failed multi-row query are inserted:
+                        # insert them by the single-row query to stop at the failed record
+                        break
+
+                    start += chunk_size
+
+            records = records[start:]
+
+        cursor.executemany(query, records)
+
+    def __make_insert_error(
+        self, query: str, e: sqlite3.Error, records: Sequence[Sequence]
+    ) -> OperationalError:
+        caller = logging.getLogger().findCaller(stacklevel=2)
+        file_path, line_no, func_name = caller[:3]
+
+        return OperationalError(
+            f"{file_path:s}({line_no:d}) {func_name:s}: failed to execute query:\n"
+            + f"  query={query}\n"
+            + f"  msg='{e}'\n"
+            + f"  db={self.database_path}\n"
+            + f"  records={records[:2]}\n"
+        )
+
     def __delayed_connect(self) -> bool:
         if self.__delayed_connection_path is None:
             return False
@@ -1743,14 +1936,8 @@ class SimpleSQLite:
         :rtype: dictionary
         """
 
-        typename_table = {
-            typepy.Typecode.INTEGER: "INTEGER",
-            typepy.Typecode.REAL_NUMBER: "REAL",
-            typepy.Typecode.STRING: "TEXT",
-        }
-
         return {
-            col_idx: typename_table.get(col_dp.typecode, "TEXT")
+            col_idx: _typecode_to_sqlitetype.get(col_dp.typecode, "TEXT")
             for col_idx, col_dp in enumerate(table_data.column_dp_list)
         }
 
@@ -1763,14 +1950,17 @@ class SimpleSQLite:
     ) -> None:
         self.validate_access_permission(["w", "a"])
 
-        debug_msg_list = ["__create_table_from_tabledata:", f"    tbldata={table_data}"]
-        if primary_key:
-            debug_msg_list.append(f"    primary_key={primary_key}")
-        if add_primary_key_column:
-            debug_msg_list.append(f"    add_primary_key_column={add_primary_key_column}")
-        if index_attrs:
-            debug_msg_list.append(f"    index_attrs={index_attrs}")
-        logger.debug("\n".join(debug_msg_list))
+        logger.debug(
+            "__create_table_from_tabledata:\n"
+            "    tbldata={}\n"
+            "    primary_key={}\n"
+            "    add_primary_key_column={}\n"
+            "    index_attrs={}",
+            table_data,
+            primary_key,
+            add_primary_key_column,
+            index_attrs,
+        )
 
         if table_data.is_empty():
             raise ValueError(f"input table_data is empty: {table_data}")
@@ -1795,7 +1985,6 @@ class SimpleSQLite:
 
         if typepy.is_not_empty_sequence(index_attrs):
             self.create_index_list(table_name, AttrList.sanitize(index_attrs))  # type: ignore
-        self.commit()
 
 
 def connect_memdb(max_workers: Optional[int] = None) -> SimpleSQLite:
@@ -5,9 +5,10 @@
 import re
 import warnings
 from collections import OrderedDict
-from collections.abc import Generator, Sequence
+from collections.abc import Generator, Iterable, Sequence
+from itertools import groupby
 from sqlite3 import Cursor
-from typing import Any, Optional, Union, cast
+from typing import Any, Final, Optional, Union, cast
 
 import typepy
 from sqliteschema import SQLiteTableSchema
@@ -74,20 +75,26 @@ class Blob(Column):
 
 
 class Model:
+    __RE_PRIVATE_VAR: Final = re.compile("^_Model__[a-zA-Z]+")
+
     __connection: SimpleSQLite
     __is_hidden = False
     __table_name: Optional[str] = None
     __attr_names: list[str] = []
+    __column_names: list[str] = []
 
     @classmethod
     def attach(cls, database_src: SimpleSQLite, is_hidden: bool = False) -> None:
         cls.__connection = SimpleSQLite(database_src)
         cls.__is_hidden = is_hidden
+        cls.__table_name = None
 
     @classmethod
     def get_table_name(cls) -> str:
-        if cls.__table_name:
-            return cls.__table_name
+        # look up the cache of the class itself: subclasses have their own table names
+        table_name = cls.__dict__.get("_Model__table_name")
+        if table_name:
+            return table_name
 
         table_name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", cls.__name__)
         table_name = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", table_name)
@@ -117,15 +124,8 @@ class Model:
         cls.__validate_connection()
         assert cls.__connection  # to avoid type check error
 
-        attr_descs = []
-
-        for attr_name in cls.get_attr_names():
-            col = cls._get_col(attr_name, validate_name=False)
-            attr_descs.append(
-                "{attr} {constraints}".format(
-                    attr=Attr(col.get_column_name()), constraints=col.get_desc()
-                )
-            )
+        cols = [cls._get_col(attr_name, validate_name=False) for attr_name in cls.get_attr_names()]
+        attr_descs = [f"{Attr(col.get_column_name())} {col.get_desc()}" for col in cols]
 
         cls.__connection.create_table(cls.get_table_name(), attr_descs)
 
@@ -136,24 +136,20 @@ class Model:
         assert cls.__connection.connection  # to avoid type check error
 
         stash_row_factory = cls.__connection.connection.row_factory
+        attr_names = cls.get_attr_names()
 
         try:
-            cls.__connection.set_row_factory(dict_factory)
+            cls.__connection.set_row_factory(None)
 
             result = cls.__connection.select(
-                select=AttrList(
-                    [
-                        cls._get_col(attr_name, validate_name=False).get_column_name()
-                        for attr_name in cls.get_attr_names()
-                    ]
-                ),
+                select=AttrList(cls.__get_column_names()),
                 table_name=cls.get_table_name(),
                 where=where,
                 extra=extra,
             )
             assert result  # to avoid type check error
-            for record in result.fetchall():
-                yield cls(**record)
+            for row in result.fetchall():
+                yield cls.__from_row(attr_names, row)
         finally:
             cls.__connection.set_row_factory(stash_row_factory)
 
@@ -162,29 +158,36 @@ class Model:
         cls.__validate_connection()
         assert cls.__connection  # to avoid type check error
 
-        if type(model_obj).__name__ != cls.__name__:
-            raise TypeError(
-                "unexpected type: expected={}, actual={}".format(
-                    cls.__name__, type(model_obj).__name__
-                )
-            )
-
-        record = {}
-
-        for attr_name in cls.get_attr_names():
-            if attr_name in model_obj.__no_value_columns:
-                continue
-
-            value = getattr(model_obj, attr_name)
-            cls.__validate_value(attr_name, value)
-
-            record[cls._get_col(attr_name, validate_name=False).get_column_name()] = value
+        record = cls.__to_record(model_obj)
 
         try:
             cls.__connection.insert(cls.get_table_name(), record, list(record.keys()))
         except TableNotFoundError as e:
             raise RuntimeError(f"{e}: execute 'create' method before insert")
 
+    @classmethod
+    def insert_many(cls, model_objs: Iterable["Model"]) -> int:
+        cls.__validate_connection()
+        assert cls.__connection  # to avoid type check error
+
+        num_inserted = 0
+
+        # consecutive records that have values for the same columns are inserted at once:
+        # columns without values are omitted from a query to apply their default values
+        for column_names, records in groupby(
+            map(cls.__to_record, model_objs), key=lambda record: tuple(record.keys())
+        ):
+            try:
+                num_inserted += cls.__connection.insert_many(
+                    cls.get_table_name(),
+                    [list(record.values()) for record in records],
+                    list(column_names),
+                )
+            except TableNotFoundError as e:
+                raise RuntimeError(f"{e}: execute 'create' method before insert")
+
+        return num_inserted
+
     @classmethod
     def update(
         cls, set_query: Union[str, Sequence[SetQuery]], where: Optional[WhereQuery] = None
@@ -282,6 +285,51 @@ class Model:
                 if value is None:
                     self.__no_value_columns.add(attr_name)
 
+    @classmethod
+    def __to_record(cls, model_obj: "Model") -> dict[str, Any]:
+        if type(model_obj).__name__ != cls.__name__:
+            raise TypeError(
+                "unexpected type: expected={}, actual={}".format(
+                    cls.__name__, type(model_obj).__name__
+                )
+            )
+
+        record = {}
+
+        for attr_name in cls.get_attr_names():
+            if attr_name in model_obj.__no_value_columns:
+                continue
+
+            value = getattr(model_obj, attr_name)
+            cls.__validate_value(attr_name, value)
+
+            record[cls._get_col(attr_name, validate_name=False).get_column_name()] = value
+
+        return record
+
+    @classmethod
+    def __get_column_names(cls) -> list[str]:
+        # look up the cache of the class itself: subclasses have their own columns
+        column_names = cls.__dict__.get("_Model__column_names")
+        if column_names:
+            return column_names
+
+        cls.__column_names = [
+            cls._get_col(attr_name, validate_name=False).get_column_name()
+            for attr_name in cls.get_attr_names()
+        ]
+
+        return cls.__column_names
+
+    @classmethod
+    def __from_row(cls, attr_names: Sequence[str], row: Sequence) -> "Model":
+        # bypass __init__: setting attributes one by one updates the no-value columns each time
+        model_obj = cls.__new__(cls)
+        model_obj.__dict__.update(zip(attr_names, row))
+        model_obj.__update_no_value_columns()
+
+        return model_obj
+
     @classmethod
     def __validate_connection(cls) -> None:
         if cls.__connection is None:
@@ -298,11 +346,9 @@ class Model:
 
     @classmethod
     def __is_attr(cls, attr_name: str) -> bool:
-        private_var_regexp = re.compile(f"^_{Model.__name__}__[a-zA-Z]+")
-
         return (
             not attr_name.startswith("__")
-            and private_var_regexp.search(attr_name) is None
+            and cls.__RE_PRIVATE_VAR.search(attr_name) is None
             and not callable(cls.__dict__.get(attr_name))
         )
 
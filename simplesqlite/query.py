@@ -3,6 +3,8 @@
 """
 
 import abc
+import functools
+import hashlib
 import re
 from collections.abc import Sequence
 from typing import Any, Final, Optional, Union
@@ -20,6 +22,10 @@ from .error import SqlSyntaxError
 WhereQuery = Union[str, "Where", "And", "Or"]
 
 
+def _has_space(text: str) -> bool:
+    return any(c.isspace() for c in text)
+
+
 class QueryItemInterface(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def to_query(self) -> str:  # pragma: no cover
@@ -55,16 +61,18 @@ class Table(QueryItem):
         "'string length'"
     """
 
-    __RE_NEED_BRACKET: Final = re.compile("[{:s}]|^[0-9]+".format(re.escape("%()-+/.,")))
-    __RE_NEED_QUOTE: Final = re.compile(r"[\s]+")
+    __NEED_BRACKET_CHARS: Final = frozenset("%()-+/.,")
 
     def to_query(self) -> str:
-        name = self._value
+        return self.__to_query(self._value)
 
-        if self.__RE_NEED_BRACKET.search(name):
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def __to_query(cls, name: str) -> str:
+        if not cls.__NEED_BRACKET_CHARS.isdisjoint(name) or "0" <= name[:1] <= "9":
             return f"[{name:s}]"
 
-        if self.__RE_NEED_QUOTE.search(name):
+        if _has_space(name):
             return f"'{name:s}'"
 
         return name
@@ -88,16 +96,14 @@ class Attr(QueryItem):
         'SUM(key)'
     """
 
-    __RE_NEED_QUOTE: Final = re.compile("[{:s}]".format(re.escape("[]_")))
-    __RE_NEED_BRACKET: Final = re.compile(
-        r"[{:s}0-9\s]".format(re.escape("%(){}-+/.;:`'\"\0\\*?<>|!#&=~^@"))
-    )
+    __NEED_QUOTE_CHARS: Final = frozenset("[]_")
+    __NEED_BRACKET_CHARS: Final = frozenset("%(){}-+/.;:`'\"\0\\*?<>|!#&=~^@0123456789")
     __RE_SANITIZE: Final = re.compile("[{:s}\n\r]".format(re.escape("'\",")))
 
     @classmethod
     def sanitize(cls, name: str) -> str:
         try:
-            return cls.__RE_SANITIZE.sub("_", name)
+            return cls.__sanitize(name)
         except TypeError:
             return str(name)
 
@@ -107,8 +113,18 @@ class Attr(QueryItem):
         self.__operation = operation
 
     def to_query(self) -> str:
-        name = self.sanitize(self._value)
-        need_quote = self.__RE_NEED_QUOTE.search(name) is not None
+        return self.__to_query(self._value, self.__operation)
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def __sanitize(cls, name: str) -> str:
+        return cls.__RE_SANITIZE.sub("_", name)
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def __to_query(cls, value: str, operation: str) -> str:
+        name = cls.sanitize(value)
+        need_quote = not cls.__NEED_QUOTE_CHARS.isdisjoint(name)
 
         try:
             validate_sqlite_attr_name(name)
@@ -126,15 +142,15 @@ class Attr(QueryItem):
 
         if need_quote:
             sql_name = f'"{name:s}"'
-        elif self.__RE_NEED_BRACKET.search(name):
+        elif not cls.__NEED_BRACKET_CHARS.isdisjoint(name) or _has_space(name):
             sql_name = f"[{name:s}]"
         elif name == "join":
             sql_name = f"[{name:s}]"
         else:
             sql_name = name
 
-        if typepy.is_not_null_string(self.__operation):
-            sql_name = f"{self.__operation:s}({sql_name:s})"
+        if typepy.is_not_null_string(operation):
+            sql_name = f"{operation:s}({sql_name:s})"
 
         return sql_name
 
@@ -175,7 +191,7 @@ class AttrList(list, QueryItemInterface):
         return self.to_query()
 
     def to_query(self) -> str:
-        return ",".join([str(attr) for attr in self])
+        return ",".join([attr.to_query() for attr in self])
 
     def append(self, item: Union[str, Attr]) -> None:
         if not isinstance(item, (str, Attr)):
@@ -477,13 +493,19 @@ class InsertMany(QueryItem):
 
     :param str table: Table name of executing the query.
     :param AttrList attrs: Attributes that inserting to..
+    :param int num_records:
+        Number of records inserted by a query:
+        parameters of the records are flattened in the order of the records.
     :raises simplesqlite.NameValidationError:
         |raises_validate_table_name|
     """
 
-    def __init__(self, table: str, attrs: AttrList) -> None:
+    def __init__(self, table: str, attrs: AttrList, num_records: int = 1) -> None:
         validate_table_name(table)
 
+        if num_records < 1:
+            raise ValueError(f"num_records must be greater than zero: actual={num_records}")
+
         if not isinstance(attrs, AttrList):
             raise TypeError(f"attr must be a AttrList class instance: actual={type(attrs)}")
 
@@ -492,12 +514,13 @@ class InsertMany(QueryItem):
 
         self.__table = table
         self.__attrs = attrs
+        self.__num_records = num_records
 
     def to_query(self) -> str:
-        return "INSERT INTO {:s}({:s}) VALUES ({:s})".format(
+        return "INSERT INTO {:s}({:s}) VALUES {:s}".format(
             Table(self.__table),
             ",".join([attr.to_query() for attr in self.__attrs]),
-            ",".join(["?" for _ in self.__attrs]),
+            ",".join(["({:s})".format(",".join("?" * len(self.__attrs)))] * self.__num_records),
         )
 
 
@@ -519,15 +542,16 @@ class Set(QueryItem):
         return f"{self.__lhs} = {self.__rhs}"
 
 
-def make_index_name(table_name: str, attr_name: str) -> str:
-    import hashlib
+__RE_INVALID_INDEX_NAME_CHARS: Final = re.compile(
+    "[{:s}]".format(re.escape("".join(ascii_symbols + unprintable_ascii_chars))), re.UNICODE
+)
 
-    re_invalid_chars = re.compile(
-        "[{:s}]".format(re.escape("".join(ascii_symbols + unprintable_ascii_chars))), re.UNICODE
-    )
 
+def make_index_name(table_name: str, attr_name: str) -> str:
     index_hash = hashlib.md5((table_name + attr_name).encode("utf8")).hexdigest()[:4]
 
     return "{:s}_{:s}_index_{}".format(
-        re_invalid_chars.sub("", table_name), re_invalid_chars.sub("", attr_name), index_hash
+        __RE_INVALID_INDEX_NAME_CHARS.sub("", table_name),
+        __RE_INVALID_INDEX_NAME_CHARS.sub("", attr_name),
+        index_hash,
     )
@@ -3,6 +3,8 @@
 """
 
 from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 
 import pytest
 
@@ -33,6 +35,25 @@ class Test_RecordConvertor_to_record:
             [attrs_2, NamedTuple2(None, None), [None, None]],
             [attrs_2, NamedTuple3(5, 6, 7), [5, 6]],
             [attrs_3, NamedTuple3(5, 6, 7), [5, 6, 7]],
+            [attrs_3, ["a", 1.5, b"b"], ["a", 1.5, b"b"]],
+            [
+                attrs_3,
+                [Decimal("1.5"), datetime(2017, 1, 2, 3, 4, 5), True],
+                [1.5, "2017-01-02 03:04:05", True],
+            ],
+            [
+                attrs_3,
+                {"attr_a": Decimal("1.5"), "attr_b": "a", "attr_c": datetime(2017, 1, 2, 3, 4, 5)},
+                [1.5, "a", "2017-01-02 03:04:05"],
+            ],
+            [
+                attrs_2,
+                [
+                    datetime(2017, 1, 2, 3, 4, 5, 678),
+                    datetime(2017, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=9))),
+                ],
+                ["2017-01-02 03:04:05", "2017-01-02 03:04:05+0900"],
+            ],
         ],
     )
     def test_normal(self, attr_names, value, expected):
@@ -3,10 +3,13 @@
 """
 
 import pytest
+from pathvalidate.error import ValidationError
 
+import simplesqlite._func
 from simplesqlite import (
     NameValidationError,
     NullDatabaseConnectionError,
+    SimpleSQLite,
     append_table,
     connect_memdb,
     copy_table,
@@ -36,12 +39,20 @@ class Test_validate_table_name:
             ["table", NameValidationError],
             ["TABLE", NameValidationError],
             ["Table", NameValidationError],
+            [[], NameValidationError],
+            [{}, NameValidationError],
         ],
     )
     def test_exception(self, value, expected):
         with pytest.raises(expected):
             validate_table_name(value)
 
+    def test_exception_repeat(self):
+        for _ in range(2):
+            with pytest.raises(NameValidationError) as e:
+                validate_table_name("table")
+            assert isinstance(e.value.__cause__, ValidationError)
+
 
 class Test_validate_attr_name:
     @pytest.mark.parametrize(["value"], [["valid_attr_name"], ["attr_"], ["%CPU"]])
@@ -56,12 +67,20 @@ class Test_validate_attr_name:
             ["table", NameValidationError],
             ["TABLE", NameValidationError],
             ["Table", NameValidationError],
+            [[], NameValidationError],
+            [{}, NameValidationError],
         ],
     )
     def test_exception(self, value, expected):
         with pytest.raises(expected):
             validate_attr_name(value)
 
+    def test_exception_repeat(self):
+        for _ in range(2):
+            with pytest.raises(NameValidationError) as e:
+                validate_attr_name("table")
+            assert isinstance(e.value.__cause__, ValidationError)
+
 
 class Test_append_table:
     def test_normal(self, con_mix, con_empty):
@@ -82,6 +101,77 @@ class Test_append_table:
 
         assert src_data_matrix * 2 == dst_data_matrix
 
+    def test_normal_chunk(self, monkeypatch, con_mix, con_empty):
+        monkeypatch.setattr(simplesqlite._func, "FETCH_CHUNK_SIZE", 1)
+        con_mem = con_mix.select_as_memdb(TEST_TABLE_NAME)
+
+        assert append_table(src_con=con_mem, dst_con=con_empty, table_name=TEST_TABLE_NAME)
+        assert append_table(src_con=con_mem, dst_con=con_empty, table_name=TEST_TABLE_NAME)
+
+        result = con_mem.select(select="*", table_name=TEST_TABLE_NAME)
+        src_data_matrix = result.fetchall()
+        result = con_empty.select(select="*", table_name=TEST_TABLE_NAME)
+        dst_data_matrix = result.fetchall()
+
+        assert len(src_data_matrix) > 1
+        assert src_data_matrix * 2 == dst_data_matrix
+
+    def test_normal_attach(self, con_mix, con_empty):
+        con_empty.create_table_from_data_matrix(
+            TEST_TABLE_NAME, ["attr_i", "attr_f", "attr_s"], [[5, 6.6, "cc"]]
+        )
+
+        assert append_table(src_con=con_mix, dst_con=con_empty, table_name=TEST_TABLE_NAME)
+
+        assert con_empty.select(select="*", table_name=TEST_TABLE_NAME).fetchall() == [
+            (5, 6.6, "cc"),
+            (1, 2.2, "aa"),
+            (3, 4.4, "bb"),
+        ]
+        assert [row[1] for row in con_empty.execute_query("PRAGMA database_list").fetchall()] == [
+            "main"
+        ]
+
+    def test_normal_attach_index(self, tmpdir):
+        src_con = SimpleSQLite(str(tmpdir.join("src.sqlite3")), "w")
+        src_con.create_table("tbl", ["a INTEGER", "b TEXT"])
+        src_con.insert_many("tbl", [[1, "x"], [2, "y"]])
+        src_con.create_index("tbl", "b")
+        src_con.commit()
+        dst_con = SimpleSQLite(str(tmpdir.join("dst.sqlite3")), "w")
+        dst_con.create_table("tbl", ["a INTEGER", "b TEXT"])
+        dst_con.commit()
+        chunk_dst_con = connect_memdb()
+        chunk_dst_con.create_table("tbl", ["a INTEGER", "b TEXT"])
+
+        assert append_table(src_con=src_con, dst_con=dst_con, table_name="tbl")
+        assert append_table(
+            src_con=src_con.select_as_memdb("tbl"), dst_con=chunk_dst_con, table_name="tbl"
+        )
+
+        assert dst_con.select(select="*", table_name="tbl").fetchall() == [(1, "x"), (2, "y")]
+        # indices are the same as appended without a query
+        index_names = sorted(
+            row[1] for row in dst_con.execute_query("PRAGMA index_list('tbl')").fetchall()
+        )
+        assert "tbl_b_index_d3ae" in index_names
+        assert index_names == sorted(
+            row[1] for row in chunk_dst_con.execute_query("PRAGMA index_list('tbl')").fetchall()
+        )
+
+    def test_normal_same_database(self):
+        con = connect_memdb()
+        con.create_table_from_data_matrix("tbl", ["a", "b"], [[1, "x"], [2, "y"]])
+
+        assert append_table(src_con=con, dst_con=con, table_name="tbl")
+
+        assert con.select(select="*", table_name="tbl").fetchall() == [
+            (1, "x"),
+            (2, "y"),
+            (1, "x"),
+            (2, "y"),
+        ]
+
     def test_exception_mismatch_schema(self, con_mix, con_profile):
         with pytest.raises(ValueError):
             append_table(src_con=con_mix, dst_con=con_profile, table_name=TEST_TABLE_NAME)
@@ -123,6 +213,152 @@ class Test_copy_table:
             is_overwrite=True,
         )
 
+    def test_normal_chunk(self, monkeypatch, con_mix, con_empty):
+        monkeypatch.setattr(simplesqlite._func, "FETCH_CHUNK_SIZE", 1)
+        con_mem = con_mix.select_as_memdb(TEST_TABLE_NAME)
+
+        assert copy_table(
+            src_con=con_mem, dst_con=con_empty, src_table_name=TEST_TABLE_NAME, dst_table_name="dst"
+        )
+
+        result = con_mem.select(select="*", table_name=TEST_TABLE_NAME)
+        src_data_matrix = result.fetchall()
+        result = con_empty.select(select="*", table_name="dst")
+        dst_data_matrix = result.fetchall()
+
+        assert len(src_data_matrix) > 1
+        assert src_data_matrix == dst_data_matrix
+        assert con_mem.fetch_attr_type(TEST_TABLE_NAME) == con_empty.fetch_attr_type("dst")
+
+    def test_normal_memdb_dst(self, con_mix):
+        con_mem = connect_memdb()
+
+        assert copy_table(
+            src_con=con_mix, dst_con=con_mem, src_table_name=TEST_TABLE_NAME, dst_table_name="dst"
+        )
+
+        result = con_mix.select(select="*", table_name=TEST_TABLE_NAME)
+        src_data_matrix = result.fetchall()
+        result = con_mem.select(select="*", table_name="dst")
+        dst_data_matrix = result.fetchall()
+
+        assert src_data_matrix == dst_data_matrix
+        assert con_mix.fetch_attr_type(TEST_TABLE_NAME) == con_mem.fetch_attr_type("dst")
+
+    def test_normal_attach(self, tmpdir):
+        src_con = SimpleSQLite(str(tmpdir.join("src.sqlite3")), "w")
+        src_con.create_table("src table", ["id INTEGER PRIMARY KEY", "'a b' TEXT", "c REAL"])
+        src_con.insert_many("src table", [[1, "x", 1.1], [2, "it's", None]])
+        src_con.create_index("src table", "c")
+        src_con.commit()
+        dst_con = SimpleSQLite(str(tmpdir.join("dst.sqlite3")), "w")
+
+        assert copy_table(
+            src_con=src_con, dst_con=dst_con, src_table_name="src table", dst_table_name="dst-1"
+        )
+
+        assert dst_con.fetch_table_names() == ["dst_1"]
+        assert dst_con.fetch_attr_names("dst_1") == ["id", "a b", "c"]
+        assert [
+            row[1:3] for row in dst_con.execute_query("PRAGMA table_info('dst_1')").fetchall()
+        ] == [("id", "INTEGER"), ("a b", "TEXT"), ("c", "REAL")]
+        assert dst_con.select(select="*", table_name="dst_1").fetchall() == [
+            (1, "x", 1.1),
+            (2, "it's", None),
+        ]
+        assert dst_con.schema_extractor.fetch_table_schema("dst_1").primary_key == "id"
+        assert len(dst_con.execute_query("PRAGMA index_list('dst_1')").fetchall()) == 1
+        assert [row[1] for row in dst_con.execute_query("PRAGMA database_list").fetchall()] == [
+            "main"
+        ]
+
+    def test_normal_quoted_attr_names(self, tmpdir):
+        src_con = SimpleSQLite(str(tmpdir.join("src.sqlite3")), "w")
+        src_con.execute_query("""CREATE TABLE src ("it's" INTEGER, "x""y" TEXT, "no type")""")
+        src_con.execute_query("INSERT INTO src VALUES (42, 'q', '1')")
+        src_con.commit()
+        dst_con = SimpleSQLite(str(tmpdir.join("dst.sqlite3")), "w")
+
+        assert copy_table(
+            src_con=src_con, dst_con=dst_con, src_table_name="src", dst_table_name="dst"
+        )
+
+        assert dst_con.select(select="*", table_name="dst").fetchall() == [(42, "q", "1")]
+        assert [
+            row[1:3] for row in dst_con.execute_query("PRAGMA table_info('dst')").fetchall()
+        ] == [("it_s", "INTEGER"), ("x_y", "TEXT"), ("no type", "")]
+
+    def test_normal_mixed_types(self, tmpdir):
+        def make_src_con(database_path):
+            con = SimpleSQLite(database_path, "w")
+            con.execute_query(
+                "CREATE TABLE src "
+                '(id INTEGER PRIMARY KEY, v VARCHAR(10), n NUMERIC, r REAL, "no type")'
+            )
+            con.execute_query(
+                "INSERT INTO src VALUES "
+                "(1, 123, '4.0', 5, '6'), (2, 'abc', 'x', '7.5', 8), (3, NULL, 9.5, NULL, 1.5)"
+            )
+            con.commit()
+            return con
+
+        file_dst_con = SimpleSQLite(str(tmpdir.join("dst.sqlite3")), "w")
+        mem_dst_con = connect_memdb()
+
+        # copied with a query and with fetched records, respectively
+        assert copy_table(
+            src_con=make_src_con(str(tmpdir.join("src.sqlite3"))),
+            dst_con=file_dst_con,
+            src_table_name="src",
+            dst_table_name="dst",
+        )
+        assert copy_table(
+            src_con=make_src_con(":memory:"),
+            dst_con=mem_dst_con,
+            src_table_name="src",
+            dst_table_name="dst",
+        )
+
+        for con in (file_dst_con, mem_dst_con):
+            assert [
+                row[1:3] for row in con.execute_query("PRAGMA table_info('dst')").fetchall()
+            ] == [
+                ("id", "INTEGER"),
+                ("v", "VARCHAR(10)"),
+                ("n", "NUMERIC"),
+                ("r", "REAL"),
+                ("no type", ""),
+            ]
+            assert con.execute_query(
+                'SELECT id, v, typeof(v), n, typeof(n), r, "no type", typeof("no type") FROM dst'
+            ).fetchall() == [
+                (1, "123", "text", 4, "integer", 5.0, "6", "text"),
+                (2, "abc", "text", "x", "text", 7.5, 8, "integer"),
+                (3, None, "null", 9.5, "real", None, 1.5, "real"),
+            ]
+            assert con.schema_extractor.fetch_table_schema("dst").primary_key == "id"
+
+    def test_normal_same_database(self):
+        con = connect_memdb()
+        con.create_table("src", ["id INTEGER PRIMARY KEY", "value TEXT"])
+        con.insert_many("src", [[1, "a"], [2, "b"]])
+
+        assert copy_table(src_con=con, dst_con=con, src_table_name="src", dst_table_name="dst")
+
+        assert set(con.fetch_table_names()) == {"src", "dst"}
+        assert con.select(select="*", table_name="dst").fetchall() == [(1, "a"), (2, "b")]
+        assert con.schema_extractor.fetch_table_schema("dst").primary_key == "id"
+
+    def test_normal_same_database_quoted_attr_names(self):
+        con = connect_memdb()
+        con.execute_query("""CREATE TABLE src ("it's" INTEGER, "x""y" TEXT)""")
+        con.execute_query("INSERT INTO src VALUES (42, 'q')")
+
+        assert copy_table(src_con=con, dst_con=con, src_table_name="src", dst_table_name="dst")
+
+        assert con.select(select="*", table_name="dst").fetchall() == [(42, "q")]
+        assert con.fetch_attr_names("dst") == ["it_s", "x_y"]
+
 
 class Test_connect_sqlite_db_mem:
     def test_normal(self):
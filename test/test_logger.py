@@ -2,17 +2,79 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import sys
+from types import SimpleNamespace
+
 import pytest
 
 from simplesqlite import set_logger
+from simplesqlite._logger._logger import _import_pytablereader
 from simplesqlite._logger._null_logger import NullLogger
 
 
+@pytest.fixture
+def clear_import_cache():
+    _import_pytablereader.cache_clear()
+    yield
+    _import_pytablereader.cache_clear()
+
+
 class Test_set_logger:
     @pytest.mark.parametrize(["value"], [[True], [False]])
     def test_smoke(self, value):
         set_logger(value)
 
+    def test_normal_propagation(self, monkeypatch, clear_import_cache):
+        calls = []
+        monkeypatch.setattr("sqliteschema.set_logger", lambda *args: calls.append(args))
+        monkeypatch.setattr("tabledata.set_logger", lambda *args: None)
+        monkeypatch.setitem(sys.modules, "pytablereader", None)
+
+        set_logger(False)
+        set_logger(True)
+        set_logger(True)
+        set_logger(True, propagation_depth=1)
+        set_logger(True, propagation_depth=3)
+
+        # the dependencies may have been changed directly: the same state is propagated again
+        assert calls == [(False, 1), (True, 1), (True, 1), (True, 0), (True, 2)]
+
+    def test_normal_optional_dependency(self, monkeypatch, clear_import_cache):
+        calls = []
+        monkeypatch.setattr("sqliteschema.set_logger", lambda *args: None)
+        monkeypatch.setattr("tabledata.set_logger", lambda *args: None)
+        monkeypatch.setitem(
+            sys.modules,
+            "pytablereader",
+            SimpleNamespace(set_logger=lambda *args: calls.append(args)),
+        )
+
+        set_logger(True)
+        set_logger(False)
+
+        assert calls == [(True, 1), (False, 1)]
+        assert _import_pytablereader.cache_info().misses == 1
+
+    def test_normal_module_logger(self, monkeypatch, clear_import_cache):
+        calls = []
+        monkeypatch.setattr("sqliteschema.set_logger", lambda *args: None)
+        monkeypatch.setattr("tabledata.set_logger", lambda *args: None)
+        monkeypatch.setitem(sys.modules, "pytablereader", None)
+        null_logger = NullLogger()
+        monkeypatch.setattr(null_logger, "enable", lambda name: calls.append(("enable", name)))
+        monkeypatch.setattr(null_logger, "disable", lambda name: calls.append(("disable", name)))
+        monkeypatch.setattr("simplesqlite._logger._logger.logger", null_logger)
+
+        set_logger(True)
+        null_logger.disable("simplesqlite")  # changed directly
+        set_logger(True)
+
+        assert calls == [
+            ("enable", "simplesqlite"),
+            ("disable", "simplesqlite"),
+            ("enable", "simplesqlite"),
+        ]
+
 
 class Test_NullLogger:
     @pytest.mark.parametrize(["value"], [[True], [False]])
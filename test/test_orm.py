@@ -8,6 +8,19 @@ class Hoge(Model):
     name = Text()
 
 
+class Bar(Model):
+    bar_id = Integer(primary_key=True)
+    name = Text()
+
+
+class FooBar(Model):
+    foo_bar_id = Integer()
+
+
+class FooBarBaz(FooBar):
+    pass
+
+
 class Foo(Model):
     foo_id = Integer(not_null=True)
     name = Text(not_null=True)
@@ -40,3 +53,41 @@ def test_orm():
 
     result = Hoge.select(where=Where("hoge_id", 999))
     assert len(list(result)) == 0
+
+
+def test_get_table_name():
+    assert FooBar.get_table_name() == "foo_bar"
+    assert FooBarBaz.get_table_name() == "foo_bar_baz"
+
+    con = connect_memdb()
+    FooBar.attach(con, is_hidden=True)
+    assert FooBar.get_table_name() == "_foo_bar_"
+
+
+def test_select_no_value_columns():
+    con = connect_memdb()
+
+    Bar.attach(con)
+    Bar.create()
+    bar_inputs = [Bar(bar_id=1, name="a"), Bar(bar_id=2)]
+    for bar_input in bar_inputs:
+        Bar.insert(bar_input)
+
+    assert list(Bar.select()) == bar_inputs
+    assert list(Bar.select(where=Where("bar_id", 2))) == bar_inputs[1:]
+
+
+def test_insert_many():
+    con = connect_memdb()
+
+    Bar.attach(con)
+    Bar.create()
+    bar_inputs = [Bar(bar_id=1, name="a"), Bar(bar_id=2, name="b"), Bar(bar_id=3), Bar(name="d")]
+
+    assert Bar.insert_many(bar_inputs) == 4
+    assert [(bar.bar_id, bar.name) for bar in Bar.select()] == [
+        (1, "a"),
+        (2, "b"),
+        (3, None),
+        (4, "d"),
+    ]
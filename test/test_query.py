@@ -417,6 +417,16 @@ class Test_InsertMany:
     def test_normal(self, table, attrs, expected):
         assert_query_item(InsertMany(table, AttrList(attrs)), expected)
 
+    @pytest.mark.parametrize(
+        ["table", "attrs", "num_records", "expected"],
+        [
+            ["A", ["B B"], 2, "INSERT INTO A([B B]) VALUES (?),(?)"],
+            ["A", ["BB", "CC"], 3, "INSERT INTO A(BB,CC) VALUES (?,?),(?,?),(?,?)"],
+        ],
+    )
+    def test_normal_num_records(self, table, attrs, num_records, expected):
+        assert_query_item(InsertMany(table, AttrList(attrs), num_records=num_records), expected)
+
     @pytest.mark.parametrize(
         ["table", "attrs", "expected"],
         [
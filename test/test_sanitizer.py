@@ -359,3 +359,18 @@ class Test_SQLiteTableDataSanitizer_dup_col_handler:
             SQLiteTableDataSanitizer(
                 TableData(table_name, headers, []), dup_col_handler="error"
             ).normalize()
+
+    @pytest.mark.parametrize(
+        ["headers", "expected"],
+        [
+            [["a", "b", "b", "a", "b"], "duplicate column name: b"],
+            [["b", "a", "a", "b"], "duplicate column name: b"],
+        ],
+    )
+    def test_exception_message(self, headers, expected):
+        with pytest.raises(ValueError) as e:
+            SQLiteTableDataSanitizer(
+                TableData("dup", headers, []), dup_col_handler="error"
+            ).normalize()
+
+        assert str(e.value) == expected
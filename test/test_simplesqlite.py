@@ -268,7 +268,14 @@ class Test_SimpleSQLite_insert:
         result_tuple = result.fetchall()[2]
         assert result_tuple == expected
 
-    @pytest.mark.parametrize(["value", "expected"], [[[5, 6.6, "c"], (5, 6.6, "c")]])
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [
+            [[5, 6.6, "c"], (5, 6.6, "c")],
+            [[5, 6.6, "it's"], (5, 6.6, "it's")],
+            [[5, 6.6, "'a' \"b\""], (5, 6.6, "'a' \"b\"")],
+        ],
+    )
     def test_mix(self, con_mix, value, expected):
         assert con_mix.fetch_num_records(TEST_TABLE_NAME) == 2
         con_mix.insert(TEST_TABLE_NAME, record=value)
@@ -277,6 +284,25 @@ class Test_SimpleSQLite_insert:
         result_tuple = result.fetchall()[2]
         assert result_tuple == expected
 
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [
+            [[True, False, "c"], ("True", "False", "c")],
+            [[datetime.time(12, 34, 56), 6.6, [1, 2]], ("12:34:56", 6.6, "[1, 2]")],
+        ],
+    )
+    def test_normal_text_values(self, con_mix, value, expected):
+        con_mix.insert(TEST_TABLE_NAME, record=value)
+        result = con_mix.select(select="*", table_name=TEST_TABLE_NAME)
+        assert result.fetchall()[2] == expected
+
+    def test_normal_profile(self, con_profile):
+        con_profile.insert(TEST_TABLE_NAME, record=[5, 6])
+        con_profile.insert(TEST_TABLE_NAME, record=[7, 8])
+
+        profiles = {profile.sql_query: profile.count for profile in con_profile.get_profile()}
+        assert profiles['INSERT INTO test_table("attr_a","attr_b") VALUES (?,?)'] == 2
+
     def test_read_only(self, con_ro):
         with pytest.raises(IOError):
             con_ro.insert(TEST_TABLE_NAME, record=[5, 6])
@@ -289,6 +315,11 @@ class Test_SimpleSQLite_insert:
         with pytest.raises(DatabaseError):
             con.insert("view1", record=[5, 6])
 
+    @pytest.mark.parametrize(["record"], [[[5]], [[5, 6, 7]]])
+    def test_exception_num_values(self, con, record):
+        with pytest.raises(OperationalError):
+            con.insert(TEST_TABLE_NAME, record=record)
+
 
 class Test_SimpleSQLite_insert_many:
     @pytest.mark.parametrize(
@@ -317,6 +348,35 @@ class Test_SimpleSQLite_insert_many:
         result_tuple = result.fetchall()[2:]
         assert result_tuple == expected
 
+    @pytest.mark.parametrize(["num_records"], [[499], [500], [1000], [1001]])
+    def test_normal_multi_row_query(self, con, num_records):
+        records = [[i, i * 2] for i in range(num_records)]
+
+        assert con.insert_many(TEST_TABLE_NAME, records) == num_records
+        result = con.select(select="*", table_name=TEST_TABLE_NAME)
+        assert result.fetchall()[2:] == [tuple(record) for record in records]
+
+    def test_exception_multi_row_query(self, con):
+        records = [[i, i * 2] for i in range(1000)]
+        records[1] = [1]
+        records[2] = [2, 4, 6]
+
+        with pytest.raises(OperationalError):
+            con.insert_many(TEST_TABLE_NAME, records)
+
+    @pytest.mark.parametrize(["failed_idx"], [[10], [700], [999]])
+    def test_exception_multi_row_query_partial(self, con, failed_idx):
+        con.create_table("pk_table", ["attr_a INTEGER PRIMARY KEY", "attr_b INTEGER"])
+        records = [[i, i * 2] for i in range(1001)]
+        records[failed_idx] = [0, 0]
+
+        with pytest.raises(OperationalError):
+            con.insert_many("pk_table", records)
+
+        # the records preceding the failed record are inserted as a single-row query does
+        result = con.select(select="*", table_name="pk_table")
+        assert result.fetchall() == [tuple(record) for record in records[:failed_idx]]
+
     @pytest.mark.parametrize(
         ["table_name", "value"], [[TEST_TABLE_NAME, []], [TEST_TABLE_NAME, None]]
     )
@@ -396,6 +456,16 @@ class Test_SimpleSQLite_fetch_table_names:
         assert set(con.fetch_table_names(include_view=True)) == {TEST_TABLE_NAME, "view1"}
         assert set(con.fetch_table_names(include_view=False)) == {TEST_TABLE_NAME}
 
+    def test_normal_schema_changed(self, con):
+        assert set(con.fetch_table_names(include_view=False)) == {TEST_TABLE_NAME}
+
+        con.execute_query("CREATE TABLE query_table (a INTEGER)")
+        assert set(con.fetch_table_names(include_view=False)) == {TEST_TABLE_NAME, "query_table"}
+
+        shared_con = SimpleSQLite(con)
+        shared_con.drop_table("query_table")
+        assert set(con.fetch_table_names(include_view=False)) == {TEST_TABLE_NAME}
+
     def test_null(self, con_null):
         with pytest.raises(NullDatabaseConnectionError):
             con_null.fetch_table_names()
@@ -416,6 +486,12 @@ class Test_SimpleSQLite_fetch_attr_names:
     def test_normal(self, con, value, expected):
         assert con.fetch_attr_names(value) == expected
 
+    def test_normal_schema_changed(self, con):
+        assert con.fetch_attr_names(TEST_TABLE_NAME) == ["attr_a", "attr_b"]
+
+        con.execute_query(f"ALTER TABLE {TEST_TABLE_NAME} ADD COLUMN attr_c INTEGER")
+        assert con.fetch_attr_names(TEST_TABLE_NAME) == ["attr_a", "attr_b", "attr_c"]
+
     def test_normal_w_mysql_style_schema(self):
         database_path = "mysql_style_schema.sqlite3"
 
@@ -478,6 +554,17 @@ class Test_SimpleSQLite_has_table:
     def test_normal(self, con, value, expected):
         assert con.has_table(value) == expected
 
+    def test_normal_view(self, con):
+        assert con.has_table("view1")
+        assert not con.has_table("view1", include_view=False)
+
+    def test_normal_system_table(self, con):
+        con.execute_query("CREATE TABLE autoinc (id INTEGER PRIMARY KEY AUTOINCREMENT)")
+        con.insert("autoinc", [None])
+
+        assert con.has_table("autoinc")
+        assert not con.has_table("sqlite_sequence")
+
     def test_null(self, con_null):
         with pytest.raises(NullDatabaseConnectionError):
             con_null.has_table(TEST_TABLE_NAME)
@@ -563,6 +650,27 @@ class Test_SimpleSQLite_has_attrs:
             con_null.has_attrs(TEST_TABLE_NAME, "attr")
 
 
+class Test_SimpleSQLite_fetch_data_types:
+    def test_normal(self, con_mix):
+        assert con_mix.fetch_data_types(TEST_TABLE_NAME) == {
+            "attr_i": typepy.Integer,
+            "attr_f": typepy.RealNumber,
+            "attr_s": typepy.String,
+        }
+
+    def test_normal_schema_changed(self, con_mix):
+        type_hints = con_mix.fetch_data_types(TEST_TABLE_NAME)
+        type_hints.clear()
+
+        con_mix.execute_query(f"ALTER TABLE {TEST_TABLE_NAME} ADD COLUMN attr_x TEXT")
+        assert con_mix.fetch_data_types(TEST_TABLE_NAME) == {
+            "attr_i": typepy.Integer,
+            "attr_f": typepy.RealNumber,
+            "attr_s": typepy.String,
+            "attr_x": typepy.String,
+        }
+
+
 class Test_SimpleSQLite_get_profile:
     def test_normal(self, con):
         profile_list = con.get_profile()